@@ -18,14 +18,29 @@ Algunos encabezados comunes para esto son: X-Forwarded-For, X-Real-IP o directam
 del cliente mediante self.client_address.
 """
 
-import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 class MyHTTPRequestHandler(BaseHTTPRequestHandler):
     """
     Manejador de peticiones HTTP personalizado
     """
 
+    # Escritura totalmente bufferizada: la línea de estado, las cabeceras
+    # y el cuerpo se acumulan y salen en una única llamada send() al
+    # vaciarse el búfer, en lugar de un syscall por cada write
+    wbufsize = -1
+
+    # Tabla de despacho: ruta -> nombre del método que la atiende.
+    # Así cada petición se resuelve con una única búsqueda en el dict
+    # en lugar de una cadena de comparaciones if/elif
+    _ROUTES = {"/ip": "_handle_ip"}
+
+    # Fragmentos precodificados de la respuesta JSON de /ip: el esquema
+    # es fijo, así que basta con intercalar la IP entre ambos trozos
+    # sin pasar por json.dumps en cada petición
+    _JSON_HEAD = b'{"ip": "'
+    _JSON_TAIL = b'"}'
+
     def do_GET(self):
         """
         Método que se ejecuta cuando se recibe una petición GET.
@@ -35,28 +50,30 @@ class MyHTTPRequestHandler(BaseHTTPRequestHandler):
 
         Para otras rutas, devuelve un código de estado 404 (Not Found).
         """
-        # Implementa aquí la lógica para responder a las peticiones GET
-        # 1. Verifica la ruta solicitada (self.path)
-        # 2. Si la ruta es "/ip", envía una respuesta 200 con la IP del cliente en formato JSON
-        # 3. Si la ruta es cualquier otra, envía una respuesta 404
-
-        # PISTA: Para obtener la IP del cliente puedes usar el método auxiliar _get_client_ip()
-        if self.path == "/ip":
-            # Enviar respuesta 200 con la IP del cliente
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            
-            # Obtener la IP del cliente
-            client_ip = self._get_client_ip()
-            
-            # Crear respuesta JSON
-            response = {"ip": client_ip}
-            self.wfile.write(json.dumps(response).encode())
-        else:
+        # Buscar la ruta solicitada en la tabla de despacho
+        handler_name = self._ROUTES.get(self.path)
+        if handler_name is None:
             # Enviar respuesta 404 para rutas no existentes
-            self.send_response(404)
-            self.end_headers()
+            self.send_error(404)
+            return
+        getattr(self, handler_name)()
+
+    def _handle_ip(self):
+        """
+        Atiende la ruta `/ip` devolviendo la IP del cliente en formato JSON.
+        """
+        # Obtener la IP del cliente y componer el cuerpo completo a partir
+        # de los fragmentos precodificados
+        client_ip = self._get_client_ip()
+        body = self._JSON_HEAD + client_ip.encode('ascii') + self._JSON_TAIL
+
+        # Enviar respuesta 200 con la IP del cliente; con Content-Length
+        # el cliente puede reutilizar la conexión sin esperar al cierre
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
 
     def _get_client_ip(self):
@@ -72,20 +89,25 @@ class MyHTTPRequestHandler(BaseHTTPRequestHandler):
         # 1. Verifica si existe el encabezado 'X-Forwarded-For' (común en servidores con proxy)
         # 2. Si no existe, verifica otros encabezados comunes como 'X-Real-IP'
         # 3. Como último recurso, utiliza self.client_address[0]
-        
+
+        # Reutilizar la IP ya resuelta durante esta misma petición
+        cached = getattr(self, "_client_ip_cache", None)
+        if cached is not None:
+            return cached
+
         # Comprobar el encabezado X-Forwarded-For
         x_forwarded_for = self.headers.get('X-Forwarded-For')
         if x_forwarded_for:
-            # En caso de múltiples IPs, retorna la primera
-            return x_forwarded_for.split(',')[0].strip()
-        
-        # Comprobar el encabezado X-Real-IP
-        x_real_ip = self.headers.get('X-Real-IP')
-        if x_real_ip:
-            return x_real_ip
-        
-        # Como último recurso, utilizar la dirección del cliente directa
-        return self.client_address[0]
+            # En caso de múltiples IPs, quedarse con la primera sin
+            # trocear el encabezado completo en una lista
+            ip, _, _ = x_forwarded_for.partition(',')
+            ip = ip.strip()
+        else:
+            # Comprobar X-Real-IP y, como último recurso, la dirección directa
+            ip = self.headers.get('X-Real-IP') or self.client_address[0]
+
+        self._client_ip_cache = ip
+        return ip
 
 
 def create_server(host="localhost", port=8000):
@@ -93,7 +115,11 @@ def create_server(host="localhost", port=8000):
     Crea y configura el servidor HTTP
     """
     server_address = (host, port)
-    httpd = HTTPServer(server_address, MyHTTPRequestHandler)
+    # ThreadingHTTPServer atiende cada conexión en un hilo propio, de modo
+    # que las peticiones concurrentes no se serializan entre sí
+    httpd = ThreadingHTTPServer(server_address, MyHTTPRequestHandler)
+    # Los hilos por conexión no deben impedir que el proceso termine
+    httpd.daemon_threads = True
     return httpd
 
 def run_server(server):
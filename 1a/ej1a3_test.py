@@ -35,6 +35,7 @@ def test_ip_endpoint(server):
     response = requests.get("http://localhost:8888/ip")
     assert response.status_code == 200, "El código de estado debe ser 200."
     assert response.headers['Content-Type'] == 'application/json', "El tipo de contenido debe ser application/json."
+    assert response.headers['Content-Length'] == str(len(response.content)), "La cabecera Content-Length debe coincidir con el cuerpo."
 
     # Convertir la respuesta a JSON
     data = json.loads(response.text)
@@ -52,3 +53,21 @@ def test_nonexistent_endpoint(server):
     """
     response = requests.get("http://localhost:8888/nonexistent")
     assert response.status_code == 404, "El código de estado debe ser 404 para rutas inexistentes."
+
+def test_concurrent_requests(server):
+    """
+    Prueba que el servidor atiende varias peticiones concurrentes correctamente.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def get_ip(_):
+        return requests.get("http://localhost:8888/ip")
+
+    # Lanzar varias peticiones en paralelo
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(get_ip, range(8)))
+
+    # Todas las peticiones deben completarse con éxito
+    for response in responses:
+        assert response.status_code == 200, "Todas las peticiones concurrentes deben devolver 200."
+        assert 'ip' in json.loads(response.text), "Cada respuesta debe contener el campo 'ip'."
@@ -15,13 +15,37 @@ para entender cómo interactuar con APIs web.
 Tu tarea es completar la implementación de las funciones indicadas.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
 
-def get_gbfs_feeds():
+# Decodificador JSON: orjson (parser nativo, mucho más rápido) si está
+# instalado; en su defecto, el módulo json de la biblioteca estándar
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Sesión compartida a nivel de módulo: reutiliza la conexión TCP+TLS
+# entre peticiones consecutivas a la API
+_SESSION = requests.Session()
+
+# ETag y datos de la última respuesta correcta: enviar If-None-Match en
+# las peticiones repetidas permite al servidor responder 304 sin cuerpo
+_FEEDS_ETAG = None
+_FEEDS_CACHE = None
+
+def get_gbfs_feeds(session=None):
     """
     Realiza una petición GET a la API de GBFS de Barcelona para obtener
     la lista de feeds (endpoints) disponibles.
 
+    Args:
+        session (requests.Session, opcional): Sesión HTTP a reutilizar.
+            Si no se indica, se usa la sesión compartida del módulo.
+
     Returns:
         dict: Datos de la respuesta si se obtiene correctamente
         None: Si ocurre un error en la petición
@@ -35,14 +59,27 @@ def get_gbfs_feeds():
     # 3. Devolver los datos en formato JSON
     # 4. Manejar posibles errores (conexión, formato, etc.)
     
+    global _FEEDS_ETAG, _FEEDS_CACHE
+
     try:
-        # Realizar la petición GET
-        response = requests.get(base_url)
-        
+        # Realizar la petición GET reutilizando la sesión; enviar
+        # If-None-Match si hay un ETag y datos cacheados que reutilizar
+        if _FEEDS_ETAG and _FEEDS_CACHE is not None:
+            response = (session or _SESSION).get(
+                base_url, timeout=10, headers={'If-None-Match': _FEEDS_ETAG})
+        else:
+            response = (session or _SESSION).get(base_url, timeout=10)
+
+        # 304 Not Modified: los feeds no han cambiado desde el ETag
+        if response.status_code == 304:
+            return _FEEDS_CACHE
+
         # Verificar que la respuesta sea correcta
         if response.status_code == 200:
-            # Devolver los datos en formato JSON
-            return response.json()
+            # Recordar el ETag y decodificar los bytes de la respuesta
+            _FEEDS_ETAG = response.headers.get('ETag')
+            _FEEDS_CACHE = _loads(response.content)
+            return _FEEDS_CACHE
         else:
             # Si el código no es 200, devolver None
             return None
@@ -92,6 +129,57 @@ def extract_feeds_info(feeds_data):
         # Manejar errores en la estructura de los datos
         return None
 
+def fetch_all_feeds(feeds_info, session=None, max_workers=8):
+    """
+    Descarga en paralelo el contenido de todos los feeds indicados.
+
+    Las descargas son puramente de E/S, por lo que repartirlas entre los
+    hilos de un ThreadPoolExecutor reduce el tiempo total de la suma de
+    latencias a la latencia del feed más lento. Conviene pasar una sesión
+    compartida para reutilizar las conexiones durante el lote.
+
+    Args:
+        feeds_info (list): Lista de feeds con los campos 'name' y 'url'
+        session (requests.Session, opcional): Sesión HTTP a reutilizar.
+            Si no se indica, se usa la sesión compartida del módulo.
+        max_workers (int): Número máximo de descargas simultáneas
+
+    Returns:
+        dict: Diccionario {nombre del feed: JSON decodificado, o None si
+              la descarga de ese feed falla}
+        None: Si feeds_info es None
+    """
+    # Verificar que feeds_info no es None
+    if feeds_info is None:
+        return None
+
+    sess = session or _SESSION
+    resultados = {}
+
+    # Lanzar todas las descargas y recoger los resultados según terminan
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futuros = {
+            executor.submit(sess.get, feed['url'], timeout=10): feed['name']
+            for feed in feeds_info
+        }
+        for futuro in as_completed(futuros):
+            nombre = futuros[futuro]
+            try:
+                response = futuro.result()
+                if response.status_code == 200:
+                    resultados[nombre] = _loads(response.content)
+                else:
+                    resultados[nombre] = None
+            except requests.exceptions.RequestException:
+                # Manejar errores de conexión de cada feed por separado
+                resultados[nombre] = None
+            except ValueError:
+                # Manejar errores de formato JSON de cada feed por separado
+                resultados[nombre] = None
+
+    return resultados
+
+
 def print_feeds_summary(feeds_info):
     """
     Imprime un resumen formateado de los feeds disponibles.
@@ -11,7 +11,7 @@ import io
 import sys
 from unittest.mock import patch, MagicMock
 
-from ej1c1 import get_gbfs_feeds, extract_feeds_info, print_feeds_summary
+from ej1c1 import get_gbfs_feeds, extract_feeds_info, fetch_all_feeds, print_feeds_summary
 
 @pytest.fixture
 def sample_gbfs_response():
@@ -38,7 +38,7 @@ def sample_gbfs_response():
         "version": "2.3"
     }
 
-@patch('ej1c1.requests.get')
+@patch('ej1c1.requests.Session.get')
 def test_get_gbfs_feeds_success(mock_get, sample_gbfs_response):
     """
     Prueba la función get_gbfs_feeds cuando la petición es exitosa
@@ -46,19 +46,20 @@ def test_get_gbfs_feeds_success(mock_get, sample_gbfs_response):
     # Configurar el mock para retornar una respuesta exitosa
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = sample_gbfs_response
+    mock_response.content = json.dumps(sample_gbfs_response).encode()
+    mock_response.headers = {}
     mock_get.return_value = mock_response
 
     # Ejecutar la función
     result = get_gbfs_feeds()
 
     # Verificar que se llamó a requests.get con la URL correcta
-    mock_get.assert_called_once_with("https://barcelona-sp.publicbikesystem.net/customer/gbfs/v2/gbfs.json")
+    mock_get.assert_called_once_with("https://barcelona-sp.publicbikesystem.net/customer/gbfs/v2/gbfs.json", timeout=10)
 
     # Verificar que el resultado es el esperado
     assert result == sample_gbfs_response, "La función debe devolver los datos JSON de la respuesta"
 
-@patch('ej1c1.requests.get')
+@patch('ej1c1.requests.Session.get')
 def test_get_gbfs_feeds_error_status(mock_get):
     """
     Prueba la función get_gbfs_feeds cuando la petición devuelve un código de error
@@ -74,7 +75,7 @@ def test_get_gbfs_feeds_error_status(mock_get):
     # Verificar que el resultado es None cuando hay un error
     assert result is None, "La función debe devolver None cuando hay un error de estado HTTP"
 
-@patch('ej1c1.requests.get')
+@patch('ej1c1.requests.Session.get')
 def test_get_gbfs_feeds_connection_error(mock_get):
     """
     Prueba la función get_gbfs_feeds cuando ocurre un error de conexión
@@ -133,6 +134,68 @@ def test_extract_feeds_info_invalid_format():
     # Verificar que el resultado es None
     assert result is None, "La función debe devolver None cuando el formato de datos es inválido"
 
+@patch('ej1c1.requests.Session.get')
+def test_fetch_all_feeds(mock_get, sample_gbfs_response):
+    """
+    Prueba la función fetch_all_feeds con varias descargas simuladas
+    """
+    # Configurar el mock para responder con un payload distinto según la URL
+    def fake_get(url, timeout=None):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"source": url}).encode()
+        return mock_response
+
+    mock_get.side_effect = fake_get
+
+    # Descargar todos los feeds de la respuesta de ejemplo
+    feeds_info = extract_feeds_info(sample_gbfs_response)
+    result = fetch_all_feeds(feeds_info)
+
+    # Verificar que se descargaron todos los feeds con su contenido
+    assert isinstance(result, dict), "La función debe devolver un diccionario"
+    assert len(result) == len(feeds_info), "Debe haber una entrada por feed"
+    for feed in feeds_info:
+        assert result[feed['name']] == {"source": feed['url']}, "Cada feed debe asociarse a su contenido"
+
+@patch('ej1c1.requests.Session.get')
+def test_fetch_all_feeds_invalid_json(mock_get, sample_gbfs_response):
+    """
+    Prueba que un feed con JSON inválido devuelve None sin abortar el lote
+    """
+    # Configurar el mock: el primer feed responde con HTML, el resto con JSON
+    feeds_info = extract_feeds_info(sample_gbfs_response)
+    url_invalida = feeds_info[0]['url']
+
+    def fake_get(url, timeout=None):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        if url == url_invalida:
+            mock_response.content = b"<html>Service Unavailable</html>"
+        else:
+            mock_response.content = json.dumps({"source": url}).encode()
+        return mock_response
+
+    mock_get.side_effect = fake_get
+
+    # Descargar todos los feeds
+    result = fetch_all_feeds(feeds_info)
+
+    # El feed corrupto debe ser None y los demás conservar su contenido
+    assert result[feeds_info[0]['name']] is None, "El feed con JSON inválido debe ser None"
+    for feed in feeds_info[1:]:
+        assert result[feed['name']] == {"source": feed['url']}, "El resto de feeds debe descargarse con normalidad"
+
+def test_fetch_all_feeds_none_input():
+    """
+    Prueba la función fetch_all_feeds cuando se proporciona None como entrada
+    """
+    # Ejecutar la función con None como entrada
+    result = fetch_all_feeds(None)
+
+    # Verificar que el resultado es None
+    assert result is None, "La función debe devolver None cuando la entrada es None"
+
 def test_print_feeds_summary(sample_gbfs_response, capsys):
     """
     Prueba la función print_feeds_summary cuando se proporcionan feeds válidos
@@ -23,8 +23,28 @@ Esta práctica refuerza conceptos de POO en Python como:
 
 import requests
 import enum
+import time
+import asyncio
+import aiohttp
+from operator import attrgetter
+
+# Decodificador JSON: orjson (parser nativo, mucho más rápido) si está
+# instalado; en su defecto, el módulo json de la biblioteca estándar
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Parser JSON en streaming, para recorrer las estaciones una a una sin
+# materializar el árbol completo en memoria
+try:
+    import ijson
+except ImportError:
+    ijson = None
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
 
@@ -39,11 +59,31 @@ class StationStatus(enum.Enum):
     OUT_OF_SERVICE = "OUT_OF_SERVICE"
 
 
+# Tabla valor -> miembro del enum: un dict.get con valor por defecto es
+# mucho más barato que StationStatus(valor) dentro de un try/except,
+# que se ejecuta una vez por estación
+_STATUS_MAP = {member.value: member for member in StationStatus}
+
+# Centinela devuelto por _fetch_status_payload cuando el servidor
+# responde 304 Not Modified y puede reutilizarse la respuesta cacheada
+_NOT_MODIFIED = object()
+
+# Accesores construidos una sola vez para los bucles de filtrado:
+# attrgetter resuelve el atributo en una única llamada a nivel C en
+# lugar de un LOAD_ATTR de bytecode por estación
+_get_bikes = attrgetter('num_bikes_available')
+_is_operational = attrgetter('is_operational')
+
+
 @dataclass
 class VehicleType:
     """
     Clase que representa un tipo de vehículo y su cantidad disponible.
     """
+    # __slots__ evita el __dict__ por instancia: se crean cientos de
+    # objetos por consulta y el conjunto de atributos es fijo
+    __slots__ = ('vehicle_type_id', 'count')
+
     # Añade aquí los atributos necesarios: tipo de vehículo (vehicle_type_id) y cantidad (count)
     vehicle_type_id: str
     count: int
@@ -64,7 +104,15 @@ class StationStatusInfo:
         last_reported: Timestamp del último reporte de estado
         vehicle_types: Lista de tipos de vehículos disponibles
     """
-    
+
+    # __slots__ reduce la memoria por instancia (~2x) y acelera el acceso
+    # a atributos; el conjunto de atributos de la clase es fijo
+    __slots__ = (
+        'station_id', 'status', 'num_bikes_available', 'num_bikes_disabled',
+        'num_docks_available', 'is_renting', 'is_returning', 'last_reported',
+        '_raw_vehicle_types', '_vehicle_types', '_last_reported_dt',
+    )
+
     def __init__(self, station_data):
         """
         Inicializa una instancia de StationStatusInfo a partir de los datos
@@ -77,13 +125,11 @@ class StationStatusInfo:
         # a partir del diccionario station_data
         self.station_id = station_data.get('station_id')
         
-        # Convertir el estado de string a enum
-        status_str = station_data.get('status', 'IN_SERVICE')
-        try:
-            self.status = StationStatus(status_str)
-        except ValueError:
-            self.status = StationStatus.IN_SERVICE
-        
+        # Convertir el estado de string a enum mediante la tabla de
+        # búsqueda, con IN_SERVICE como valor por defecto
+        self.status = _STATUS_MAP.get(station_data.get('status'),
+                                      StationStatus.IN_SERVICE)
+
         self.num_bikes_available = station_data.get('num_bikes_available', 0)
         self.num_bikes_disabled = station_data.get('num_bikes_disabled', 0)
         self.num_docks_available = station_data.get('num_docks_available', 0)
@@ -91,15 +137,47 @@ class StationStatusInfo:
         self.is_returning = station_data.get('is_returning', False)
         self.last_reported = station_data.get('last_reported')
         
-        # Procesar la lista de tipos de vehículos disponibles
-        self.vehicle_types = []
-        vehicle_types_data = station_data.get('vehicle_types_available', [])
-        for vt_data in vehicle_types_data:
-            self.vehicle_types.append(VehicleType(
-                vehicle_type_id=vt_data.get('vehicle_type_id', ''),
-                count=vt_data.get('count', 0)
-            ))
-    
+        # Guardar la lista cruda de tipos de vehículos: los objetos
+        # VehicleType se construyen de forma diferida en la property
+        # vehicle_types, ya que la mayoría de consumidores no los usan
+        self._raw_vehicle_types = station_data.get('vehicle_types_available', ())
+        self._vehicle_types = None
+        self._last_reported_dt = None
+
+    @property
+    def vehicle_types(self) -> List[VehicleType]:
+        """
+        Lista de tipos de vehículos disponibles en la estación.
+
+        Se construye de forma perezosa en el primer acceso y se memoiza
+        en un slot privado (la clase no tiene __dict__), evitando crear
+        los objetos VehicleType en el camino caliente de los filtros que
+        solo consultan contadores.
+        """
+        if self._vehicle_types is None:
+            self._vehicle_types = [
+                VehicleType(
+                    vehicle_type_id=vt_data.get('vehicle_type_id', ''),
+                    count=vt_data.get('count', 0)
+                )
+                for vt_data in self._raw_vehicle_types
+            ]
+        return self._vehicle_types
+
+    @property
+    def last_reported_dt(self) -> Optional[datetime]:
+        """
+        Timestamp del último reporte de estado como objeto datetime.
+
+        La conversión se realiza una única vez en el primer acceso y se
+        memoiza en un slot privado; last_reported conserva el entero
+        crudo de la API, de modo que quien repita el acceso no paga un
+        datetime.fromtimestamp por lectura.
+        """
+        if self._last_reported_dt is None and self.last_reported:
+            self._last_reported_dt = datetime.fromtimestamp(self.last_reported)
+        return self._last_reported_dt
+
     @property
     def is_operational(self) -> bool:
         """
@@ -125,11 +203,12 @@ class StationStatusInfo:
                             y el valor es la cantidad disponible
         """
         # Implementa aquí la lógica para devolver un diccionario
-        # con la cantidad de bicicletas disponibles por tipo
-        result = {}
-        for vehicle_type in self.vehicle_types:
-            result[vehicle_type.vehicle_type_id] = vehicle_type.count
-        return result
+        # con la cantidad de bicicletas disponibles por tipo, leyendo
+        # los datos crudos sin construir los objetos VehicleType
+        return {
+            vt_data.get('vehicle_type_id', ''): vt_data.get('count', 0)
+            for vt_data in self._raw_vehicle_types
+        }
     
     def __str__(self) -> str:
         """
@@ -153,13 +232,38 @@ class BarcelonaBikingClient:
     Cliente para consultar el estado de las estaciones de bicicletas de Barcelona.
     """
     
-    def __init__(self):
+    def __init__(self, stream=False):
         """
-        Inicializa el cliente con la URL base de la API.
+        Inicializa el cliente con la URL base de la API y una sesión HTTP
+        reutilizable para aprovechar el keep-alive de las conexiones.
+
+        Args:
+            stream: Si es True (y la librería ijson está instalada), el
+                payload de station_status se parsea en streaming estación
+                a estación, manteniendo el consumo de memoria constante
+                en lugar de proporcional al tamaño de la respuesta
         """
         self.base_url = "https://barcelona.publicbikesystem.net/customer/gbfs/v2/en"
         self.station_status_url = f"{self.base_url}/station_status"
-    
+        # Reutilizar la misma sesión evita repetir el handshake TCP+TLS
+        # en cada petición a la API
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        # Caché en memoria del último station_status: la API solo se
+        # actualiza cada ~10 segundos, así que repetir la petición antes
+        # de ese intervalo solo repite trabajo de red y de parseo
+        self._cache = None
+        self._cache_ts = 0.0
+        self._cache_ttl = 10.0
+        # Índice {station_id: StationStatusInfo} de la última lista de
+        # estaciones, para resolver búsquedas por ID en O(1)
+        self._by_id = None
+        self._by_id_source = None
+        self._stream = stream and ijson is not None
+        # ETag de la última respuesta, para peticiones condicionales con
+        # If-None-Match: un 304 evita el cuerpo y el parseo por completo
+        self._last_etag = None
+
     def get_stations_status(self) -> Tuple[List[StationStatusInfo], Optional[datetime]]:
         """
         Obtiene el estado actual de todas las estaciones de bicicletas.
@@ -175,34 +279,139 @@ class BarcelonaBikingClient:
         # 3. Crear objetos StationStatusInfo para cada estación en la respuesta
         # 4. Extraer el timestamp de last_updated de la respuesta
         # 5. Manejar posibles errores (conexión, formato, etc.)
-        try:
-            # Realizar la petición GET
-            response = requests.get(self.station_status_url)
-            
-            # Verificar que la respuesta sea correcta
-            if response.status_code != 200:
+        # Devolver la respuesta memoizada si todavía está vigente
+        if self._cache and time.monotonic() - self._cache_ts < self._cache_ttl:
+            return self._cache
+
+        if self._stream:
+            # Parsear la respuesta en streaming, estación a estación
+            result = self._fetch_status_streaming()
+            if result is None:
                 return ([], None)
-            
-            # Obtener los datos JSON
-            json_data = response.json()
-            
+            stations, last_updated = result
+        else:
+            # Descargar y decodificar el payload de station_status
+            json_data = self._fetch_status_payload()
+            if json_data is _NOT_MODIFIED:
+                # 304 Not Modified: los datos cacheados siguen vigentes
+                self._cache_ts = time.monotonic()
+                return self._cache
+            if json_data is None:
+                return ([], None)
+
             # Extraer el timestamp de last_updated
             last_updated = json_data.get('last_updated')
-            
-            # Obtener la lista de estaciones
-            stations_data = json_data.get('data', {}).get('stations', [])
-            
-            # Crear objetos StationStatusInfo para cada estación
-            stations = [StationStatusInfo(station_data) for station_data in stations_data]
-            
-            return (stations, last_updated)
+
+            # Crear objetos StationStatusInfo para cada estación, consumiendo
+            # el generador de diccionarios crudos sin listas intermedias
+            stations = [StationStatusInfo(station_data)
+                        for station_data in self._iter_raw_stations(json_data)]
+
+        # Memoizar el resultado para las llamadas dentro del TTL
+        self._cache = (stations, last_updated)
+        self._cache_ts = time.monotonic()
+
+        return self._cache
+
+    def _fetch_status_payload(self) -> Union[dict, object, None]:
+        """
+        Descarga y decodifica el payload JSON de station_status.
+
+        Returns:
+            Union[dict, object, None]: El payload decodificado, el
+                centinela _NOT_MODIFIED (a comparar por identidad) si el
+                servidor responde 304, o None si hay error
+        """
+        try:
+            # Realizar la petición GET reutilizando la sesión del cliente;
+            # enviar If-None-Match si hay un ETag y datos cacheados que reutilizar
+            if self._last_etag and self._cache:
+                response = self._session.get(self.station_status_url, timeout=10,
+                                             headers={'If-None-Match': self._last_etag})
+            else:
+                response = self._session.get(self.station_status_url, timeout=10)
+
+            # 304 Not Modified: el contenido no ha cambiado desde el ETag
+            if response.status_code == 304:
+                return _NOT_MODIFIED
+
+            # Verificar que la respuesta sea correcta
+            if response.status_code != 200:
+                return None
+
+            # Recordar el ETag para la siguiente petición condicional
+            self._last_etag = response.headers.get('ETag')
+
+            # Decodificar los bytes de la respuesta directamente
+            return _loads(response.content)
         except requests.exceptions.RequestException:
             # Manejar errores de conexión
-            return ([], None)
+            return None
         except (ValueError, KeyError):
             # Manejar errores de formato JSON
-            return ([], None)
-    
+            return None
+
+    def _fetch_status_streaming(self):
+        """
+        Descarga station_status y lo parsea en streaming con ijson.
+
+        Cada estación se construye individualmente a medida que llegan
+        sus bytes, sin materializar nunca el árbol JSON completo, por lo
+        que el pico de memoria es O(1) respecto al número de estaciones.
+
+        Returns:
+            Optional[Tuple[List[StationStatusInfo], Optional[int]]]:
+                La tupla (estaciones, last_updated), o None si hay error
+        """
+        try:
+            response = self._session.get(self.station_status_url, timeout=10,
+                                         stream=True)
+            if response.status_code != 200:
+                return None
+
+            # response.raw entrega los bytes tal cual llegan del socket;
+            # si el servidor comprime (gzip/deflate), urllib3 debe
+            # descomprimirlos antes de que los vea el parser
+            response.raw.decode_content = True
+
+            last_updated = None
+            stations = []
+            builder = None
+
+            # Recorrer los eventos del parser: capturar last_updated y
+            # reconstruir cada estación de 'data.stations' por separado
+            for prefix, event, value in ijson.parse(response.raw):
+                if prefix == 'last_updated':
+                    last_updated = value
+                elif prefix.startswith('data.stations.item'):
+                    if event == 'start_map' and prefix == 'data.stations.item':
+                        builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    if event == 'end_map' and prefix == 'data.stations.item':
+                        stations.append(StationStatusInfo(builder.value))
+                        builder = None
+
+            return (stations, last_updated)
+        except requests.exceptions.RequestException:
+            # Manejar errores de conexión
+            return None
+        except (ValueError, AttributeError, ijson.JSONError):
+            # Manejar errores de formato o de estructura del JSON
+            return None
+
+    @staticmethod
+    def _iter_raw_stations(json_data):
+        """
+        Recorre los diccionarios crudos de estaciones de un payload.
+
+        Args:
+            json_data: Payload decodificado del endpoint station_status
+
+        Yields:
+            dict: Datos crudos de cada estación
+        """
+        yield from json_data.get('data', {}).get('stations', [])
+
     def find_station_by_id(self, station_id: str) -> Optional[StationStatusInfo]:
         """
         Busca una estación específica por su ID.
@@ -216,10 +425,14 @@ class BarcelonaBikingClient:
         """
         # Implementa aquí la lógica para buscar y devolver una estación por su ID
         stations, _ = self.get_stations_status()
-        for station in stations:
-            if station.station_id == station_id:
-                return station
-        return None
+
+        # Reconstruir el índice solo cuando cambia la lista de estaciones,
+        # de modo que M búsquedas cuestan O(N + M) en lugar de O(N * M)
+        if self._by_id_source is not stations:
+            self._by_id = {station.station_id: station for station in stations}
+            self._by_id_source = stations
+
+        return self._by_id.get(station_id)
     
     def get_operational_stations(self) -> List[StationStatusInfo]:
         """
@@ -230,7 +443,7 @@ class BarcelonaBikingClient:
         """
         # Implementa aquí la lógica para filtrar y devolver solo las estaciones operativas
         stations, _ = self.get_stations_status()
-        return [station for station in stations if station.is_operational]
+        return [station for station in stations if _is_operational(station)]
     
     def get_stations_with_available_bikes(self, min_bikes: int = 1) -> List[StationStatusInfo]:
         """
@@ -245,7 +458,120 @@ class BarcelonaBikingClient:
         # Implementa aquí la lógica para filtrar y devolver las estaciones
         # con al menos min_bikes disponibles
         stations, _ = self.get_stations_status()
-        return [station for station in stations if station.num_bikes_available >= min_bikes]
+        return [station for station in stations if _get_bikes(station) >= min_bikes]
+
+    def invalidate_cache(self) -> None:
+        """
+        Descarta la respuesta memoizada para forzar una nueva petición
+        en la siguiente llamada a get_stations_status.
+        """
+        self._cache = None
+        self._cache_ts = 0.0
+
+    def close(self) -> None:
+        """
+        Cierra la sesión HTTP del cliente y libera sus conexiones.
+        """
+        self._session.close()
+
+    def __enter__(self) -> "BarcelonaBikingClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class AsyncBarcelonaBikingClient:
+    """
+    Versión asíncrona del cliente basada en aiohttp.
+
+    Al ser las peticiones puramente de E/S, un event loop permite
+    solapar varias descargas (por ejemplo station_status junto con
+    station_information), de forma que el tiempo total es el de la
+    petición más lenta en lugar de la suma de todas.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el cliente asíncrono con la URL base de la API.
+        La sesión aiohttp se crea de forma diferida dentro del event loop.
+        """
+        self.base_url = "https://barcelona.publicbikesystem.net/customer/gbfs/v2/en"
+        self.station_status_url = f"{self.base_url}/station_status"
+        self._session = None
+
+    async def _ensure_session(self) -> None:
+        """
+        Crea la sesión aiohttp si todavía no existe (o si fue cerrada).
+        """
+        if self._session is None or self._session.closed:
+            # Limitar las conexiones simultáneas y cachear las
+            # resoluciones DNS para reutilizarlas entre peticiones
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept": "application/json"},
+            )
+
+    async def get_stations_status(self) -> Tuple[List[StationStatusInfo], Optional[datetime]]:
+        """
+        Obtiene el estado actual de todas las estaciones de bicicletas.
+
+        Returns:
+            Tuple[List[StationStatusInfo], Optional[datetime]]:
+                - Lista de objetos StationStatusInfo, uno por cada estación
+                - Timestamp de la última actualización de los datos, o None si hay error
+        """
+        try:
+            await self._ensure_session()
+            async with self._session.get(self.station_status_url) as response:
+                if response.status != 200:
+                    return ([], None)
+                json_data = await response.json()
+
+            last_updated = json_data.get('last_updated')
+            stations_data = json_data.get('data', {}).get('stations', [])
+            stations = [StationStatusInfo(station_data) for station_data in stations_data]
+
+            return (stations, last_updated)
+        except aiohttp.ClientError:
+            # Manejar errores de conexión
+            return ([], None)
+        except (ValueError, KeyError):
+            # Manejar errores de formato JSON
+            return ([], None)
+
+    async def fetch_many(self, urls: List[str]) -> List[dict]:
+        """
+        Descarga varios endpoints GBFS en paralelo dentro del event loop.
+
+        Args:
+            urls: Lista de URLs a descargar
+
+        Returns:
+            List[dict]: Respuestas JSON en el mismo orden que las URLs
+        """
+        await self._ensure_session()
+
+        async def _fetch(url):
+            async with self._session.get(url) as response:
+                return await response.json()
+
+        return await asyncio.gather(*(_fetch(url) for url in urls))
+
+    async def close(self) -> None:
+        """
+        Cierra la sesión aiohttp del cliente.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncBarcelonaBikingClient":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
 
 if __name__ == "__main__":
@@ -5,12 +5,20 @@ de las clases y métodos que modelan el estado de las estaciones del sistema
 de bicicletas compartidas de Barcelona mediante la API GBFS.
 """
 
+import asyncio
+import json
 import pytest
 from datetime import datetime
 import requests
 from unittest.mock import patch, MagicMock
 
-from ej1c3 import StationStatus, VehicleType, StationStatusInfo, BarcelonaBikingClient
+from ej1c3 import (
+    StationStatus,
+    VehicleType,
+    StationStatusInfo,
+    BarcelonaBikingClient,
+    AsyncBarcelonaBikingClient,
+)
 
 @pytest.fixture
 def sample_station_status_response():
@@ -274,6 +282,35 @@ class TestStationStatusInfo:
         assert bikes_by_type["BOOST"] == 3, "Debe haber 3 bicicletas BOOST"
         assert bikes_by_type["ICONIC"] == 9, "Debe haber 9 bicicletas ICONIC"
     
+    def test_last_reported_dt(self, station_data_operational):
+        """
+        Verificar que last_reported_dt convierte el timestamp una sola vez
+        """
+        station = StationStatusInfo(station_data_operational)
+        reported = station.last_reported_dt
+
+        # Verificar la conversión y la memoización entre accesos
+        assert reported == datetime.fromtimestamp(1759834959), "La conversión debe corresponder al timestamp"
+        assert station.last_reported == 1759834959, "last_reported debe conservar el entero crudo"
+        assert station.last_reported_dt is reported, "El datetime debe memoizarse entre accesos"
+
+        # Sin timestamp, la property debe devolver None
+        sin_reporte = StationStatusInfo({"station_id": "x"})
+        assert sin_reporte.last_reported_dt is None, "Debe devolver None si no hay last_reported"
+
+    def test_vehicle_types_lazy(self, station_data_operational):
+        """
+        Verificar que vehicle_types construye los objetos VehicleType bajo demanda
+        """
+        station = StationStatusInfo(station_data_operational)
+        vehicle_types = station.vehicle_types
+
+        # Verificar la lista construida de forma perezosa
+        assert len(vehicle_types) == 2, "Debe haber 2 tipos de vehículos"
+        assert all(isinstance(vt, VehicleType) for vt in vehicle_types), "Todos deben ser instancias de VehicleType"
+        assert vehicle_types[0].vehicle_type_id == "BOOST", "El primer tipo debe ser BOOST"
+        assert station.vehicle_types is vehicle_types, "El resultado debe memoizarse entre accesos"
+
     def test_str_representation(self, station_data_operational):
         """
         Verificar que el método __str__ devuelve una representación adecuada
@@ -291,7 +328,7 @@ class TestBarcelonaBikingClient:
     Pruebas para la clase BarcelonaBikingClient
     """
     
-    @patch('ej1c3.requests.get')
+    @patch('ej1c3.requests.Session.get')
     def test_get_stations_status_success(self, mock_get, sample_station_status_response):
         """
         Verificar que el método get_stations_status funciona correctamente cuando la API responde
@@ -299,7 +336,8 @@ class TestBarcelonaBikingClient:
         # Configurar el mock para retornar una respuesta exitosa
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = sample_station_status_response
+        mock_response.content = json.dumps(sample_station_status_response).encode()
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         # Crear el cliente y llamar al método
@@ -307,14 +345,14 @@ class TestBarcelonaBikingClient:
         stations, last_updated = client.get_stations_status()
         
         # Verificar que se llamó a la URL correcta
-        mock_get.assert_called_once_with("https://barcelona.publicbikesystem.net/customer/gbfs/v2/en/station_status")
+        mock_get.assert_called_once_with("https://barcelona.publicbikesystem.net/customer/gbfs/v2/en/station_status", timeout=10)
         
         # Verificar que se devolvieron las estaciones y el timestamp
         assert len(stations) == 3, "Deben devolverse 3 estaciones"
         assert all(isinstance(station, StationStatusInfo) for station in stations), "Todas deben ser instancias de StationStatusInfo"
         assert last_updated == 1759835019, "El timestamp de actualización debe ser correcto"
     
-    @patch('ej1c3.requests.get')
+    @patch('ej1c3.requests.Session.get')
     def test_get_stations_status_error(self, mock_get):
         """
         Verificar que el método get_stations_status maneja correctamente los errores
@@ -329,7 +367,120 @@ class TestBarcelonaBikingClient:
         # Verificar que se devuelven valores nulos en caso de error
         assert stations == [], "Debe devolverse una lista vacía"
         assert last_updated is None, "El timestamp debe ser None"
-    
+
+    @patch('ej1c3.requests.Session.get')
+    def test_get_stations_status_cached(self, mock_get, sample_station_status_response):
+        """
+        Verificar que las llamadas dentro del TTL reutilizan la respuesta memoizada
+        """
+        # Configurar el mock para retornar una respuesta exitosa
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(sample_station_status_response).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        # Crear el cliente y llamar al método dos veces seguidas
+        client = BarcelonaBikingClient()
+        first = client.get_stations_status()
+        second = client.get_stations_status()
+
+        # La segunda llamada debe servirse de la caché sin nueva petición
+        assert mock_get.call_count == 1, "Solo debe realizarse una petición HTTP"
+        assert second is first, "La segunda llamada debe devolver el resultado memoizado"
+
+        # Tras invalidar la caché debe repetirse la petición
+        client.invalidate_cache()
+        client.get_stations_status()
+        assert mock_get.call_count == 2, "Tras invalidar la caché debe hacerse otra petición"
+
+    @patch('ej1c3.requests.Session.get')
+    def test_get_stations_status_etag(self, mock_get, sample_station_status_response):
+        """
+        Verificar que las peticiones repetidas envían If-None-Match y
+        reutilizan los datos cacheados ante un 304
+        """
+        # Primera respuesta: 200 con ETag; segunda: 304 Not Modified
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.content = json.dumps(sample_station_status_response).encode()
+        first_response.headers = {'ETag': '"abc123"'}
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [first_response, not_modified]
+
+        # Crear el cliente con TTL nulo para forzar la segunda petición
+        client = BarcelonaBikingClient()
+        client._cache_ttl = 0.0
+        first = client.get_stations_status()
+        second = client.get_stations_status()
+
+        # La segunda petición debe ser condicional y reutilizar la caché
+        assert mock_get.call_count == 2, "Deben realizarse dos peticiones HTTP"
+        mock_get.assert_called_with("https://barcelona.publicbikesystem.net/customer/gbfs/v2/en/station_status", timeout=10, headers={'If-None-Match': '"abc123"'})
+        assert second is first, "Ante un 304 debe devolverse el resultado memoizado"
+
+    @patch('ej1c3.requests.Session.get')
+    def test_get_stations_status_streaming(self, mock_get, sample_station_status_response):
+        """
+        Verificar que el modo streaming (ijson) produce el mismo resultado
+        """
+        pytest.importorskip("ijson")
+        import io
+
+        # Configurar el mock para exponer el cuerpo como flujo de bytes
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.raw = io.BytesIO(json.dumps(sample_station_status_response).encode())
+        mock_get.return_value = mock_response
+
+        # Crear el cliente en modo streaming y llamar al método
+        client = BarcelonaBikingClient(stream=True)
+        stations, last_updated = client.get_stations_status()
+
+        # Verificar que se pidió la respuesta en streaming
+        mock_get.assert_called_once_with("https://barcelona.publicbikesystem.net/customer/gbfs/v2/en/station_status", timeout=10, stream=True)
+
+        # Verificar que se devolvieron las mismas estaciones y timestamp
+        assert len(stations) == 3, "Deben devolverse 3 estaciones"
+        assert all(isinstance(station, StationStatusInfo) for station in stations), "Todas deben ser instancias de StationStatusInfo"
+        assert stations[0].station_id == "1", "La primera estación debe ser la ID 1"
+        assert stations[0].num_bikes_available == 12, "La primera estación debe tener 12 bicicletas"
+        assert last_updated == 1759835019, "El timestamp de actualización debe ser correcto"
+
+    @patch('ej1c3.requests.Session.get')
+    def test_get_stations_status_streaming_gzip(self, mock_get, sample_station_status_response):
+        """
+        Verificar que el modo streaming descomprime las respuestas gzip
+        antes de parsearlas
+        """
+        pytest.importorskip("ijson")
+        import gzip
+        import io
+        import urllib3
+
+        # Configurar el mock con un cuerpo comprimido, tal y como lo
+        # entregaría urllib3 ante un Content-Encoding: gzip real
+        comprimido = gzip.compress(json.dumps(sample_station_status_response).encode())
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.raw = urllib3.response.HTTPResponse(
+            body=io.BytesIO(comprimido),
+            headers={'Content-Encoding': 'gzip'},
+            status=200,
+            preload_content=False,
+        )
+        mock_get.return_value = mock_response
+
+        # Crear el cliente en modo streaming y llamar al método
+        client = BarcelonaBikingClient(stream=True)
+        stations, last_updated = client.get_stations_status()
+
+        # Verificar que el cuerpo comprimido se parseó correctamente
+        assert len(stations) == 3, "Deben devolverse 3 estaciones pese a la compresión"
+        assert stations[0].station_id == "1", "La primera estación debe ser la ID 1"
+        assert last_updated == 1759835019, "El timestamp de actualización debe ser correcto"
+
     @patch('ej1c3.BarcelonaBikingClient.get_stations_status')
     def test_find_station_by_id(self, mock_get_stations_status, station_data_operational, station_data_maintenance):
         """
@@ -397,3 +548,64 @@ class TestBarcelonaBikingClient:
         # Probar con un umbral diferente
         with_any_bike = client.get_stations_with_available_bikes(min_bikes=1)
         assert len(with_any_bike) == 1, "Solo debe haber 1 estación con bicicletas"
+
+class TestAsyncBarcelonaBikingClient:
+    """
+    Pruebas para la clase AsyncBarcelonaBikingClient
+    """
+
+    class _FakeResponse:
+        """Respuesta aiohttp simulada utilizable con async with"""
+
+        def __init__(self, payload, status=200):
+            self._payload = payload
+            self.status = status
+
+        async def json(self):
+            return self._payload
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            return False
+
+    def test_get_stations_status(self, sample_station_status_response):
+        """
+        Verificar que el cliente asíncrono construye las estaciones correctamente
+        """
+        # Crear el cliente con una sesión simulada ya inicializada
+        client = AsyncBarcelonaBikingClient()
+        fake_response = self._FakeResponse(sample_station_status_response)
+        client._session = MagicMock(closed=False)
+        client._session.get.return_value = fake_response
+
+        # Ejecutar la corrutina en un event loop
+        stations, last_updated = asyncio.run(client.get_stations_status())
+
+        # Verificar que se llamó a la URL correcta
+        client._session.get.assert_called_once_with("https://barcelona.publicbikesystem.net/customer/gbfs/v2/en/station_status")
+
+        # Verificar que se devolvieron las estaciones y el timestamp
+        assert len(stations) == 3, "Deben devolverse 3 estaciones"
+        assert all(isinstance(station, StationStatusInfo) for station in stations), "Todas deben ser instancias de StationStatusInfo"
+        assert last_updated == 1759835019, "El timestamp de actualización debe ser correcto"
+
+    def test_fetch_many(self):
+        """
+        Verificar que fetch_many descarga varias URLs y preserva el orden
+        """
+        # Crear el cliente con una sesión simulada que responde según la URL
+        client = AsyncBarcelonaBikingClient()
+        payloads = {
+            "https://example.test/a": {"feed": "a"},
+            "https://example.test/b": {"feed": "b"},
+        }
+        client._session = MagicMock(closed=False)
+        client._session.get.side_effect = lambda url: self._FakeResponse(payloads[url])
+
+        # Ejecutar la corrutina en un event loop
+        results = asyncio.run(client.fetch_many(list(payloads)))
+
+        # Verificar que las respuestas llegan en el mismo orden que las URLs
+        assert results == [{"feed": "a"}, {"feed": "b"}], "Las respuestas deben conservar el orden de las URLs"
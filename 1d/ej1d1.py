@@ -17,14 +17,65 @@ y permiten concentrarse en el análisis de datos en lugar de en los detalles té
 de la comunicación con la API.
 """
 
+import functools
+from operator import attrgetter
+
+import numpy as np
 import pybikes
 import pandas as pd
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import matplotlib.pyplot as plt
 import sys
 
 
+@functools.lru_cache(maxsize=1)
+def _instancias() -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Materializa una única vez el generador pybikes.get_instances().
+
+    pybikes expone miles de sistemas; recorrer el generador completo en
+    cada consulta es O(N) por llamada, así que se conserva la lista.
+    """
+    return list(pybikes.get_instances())
+
+
+@functools.lru_cache(maxsize=1)
+def _indice_por_tag() -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """
+    Construye un índice {tag: (clase, info)} para búsquedas O(1) por identificador.
+    """
+    return {
+        info['tag']: (class_name, info)
+        for class_name, info in _instancias()
+        if info.get('tag')
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _indice_ciudades() -> List[Tuple[str, str, str]]:
+    """
+    Construye una lista de tuplas (ciudad, nombre, tag) en minúsculas,
+    preparada una sola vez para las búsquedas por ciudad.
+    """
+    entradas = []
+    for _, info in _instancias():
+        meta = info.get('meta', {})
+        entradas.append((
+            meta.get('city', '').lower(),
+            meta.get('name', '').lower(),
+            info.get('tag', '')
+        ))
+    return entradas
+
+
+# Caché de sistemas ya construidos: {tag: (sistema, instante del último
+# update)}. pybikes.get() reconstruye el objeto en cada llamada y
+# update() golpea la API upstream, así que solo se refresca tras el TTL
+_SISTEMAS: Dict[str, Tuple[Any, float]] = {}
+_SISTEMA_TTL = 60.0
+
+
 def listar_sistemas_disponibles() -> List[str]:
     """
     Obtiene una lista de todos los sistemas de bicicletas disponibles en pybikes.
@@ -35,11 +86,8 @@ def listar_sistemas_disponibles() -> List[str]:
     # Implementa aquí la lógica para obtener y devolver la lista
     # de sistemas disponibles en pybikes
     try:
-        # Obtener todas las instancias de sistemas
-        instances = list(pybikes.get_instances())
-        # Extraer los tags (identificadores) de cada instancia
-        tags = [instance[1]['tag'] for instance in instances]
-        return tags
+        # Los tags son las claves del índice ya construido
+        return list(_indice_por_tag())
     except Exception:
         return []
 
@@ -59,23 +107,14 @@ def buscar_sistema_por_ciudad(ciudad: str) -> List[str]:
     try:
         resultados = []
         ciudad_lower = ciudad.lower()
-        
-        # Obtener todas las instancias
-        instances = list(pybikes.get_instances())
-        
-        # Iterar sobre todas las instancias
-        for class_name, instance_info in instances:
-            # Verificar si el nombre de la ciudad está en los metadatos
-            meta = instance_info.get('meta', {})
-            city = meta.get('city', '').lower()
-            name = meta.get('name', '').lower()
-            tag = instance_info.get('tag', '')
-            
+
+        # Iterar sobre el índice ya preparado en minúsculas
+        for city, name, tag in _indice_ciudades():
             # Buscar coincidencias en city o name
             if ciudad_lower in city or ciudad_lower in name:
                 if tag and tag not in resultados:
                     resultados.append(tag)
-        
+
         return resultados
     except Exception:
         return []
@@ -94,26 +133,22 @@ def obtener_info_sistema(tag: str) -> Dict[str, Any]:
     # Implementa aquí la lógica para obtener y devolver
     # los metadatos del sistema especificado
     try:
-        # Obtener todas las instancias
-        instances = list(pybikes.get_instances())
-        
-        # Buscar la instancia con el tag especificado
-        for class_name, instance_info in instances:
-            if instance_info.get('tag') == tag:
-                meta = instance_info.get('meta', {})
-                
-                # Crear un diccionario con los metadatos relevantes
-                result = {
-                    'tag': tag,
-                    'name': meta.get('name', ''),
-                    'city': meta.get('city', ''),
-                    'country': meta.get('country', '')
-                }
-                
-                return result
-        
-        # Si no se encuentra, devolver None
-        return None
+        # Buscar el tag en el índice en lugar de recorrer todas las instancias
+        entry = _indice_por_tag().get(tag)
+        if entry is None:
+            # Si no se encuentra, devolver None
+            return None
+
+        _, instance_info = entry
+        meta = instance_info.get('meta', {})
+
+        # Crear un diccionario con los metadatos relevantes
+        return {
+            'tag': tag,
+            'name': meta.get('name', ''),
+            'city': meta.get('city', ''),
+            'country': meta.get('country', '')
+        }
     except Exception:
         return None
 
@@ -131,12 +166,20 @@ def obtener_estaciones(tag: str) -> Optional[List]:
     # Implementa aquí la lógica para obtener y devolver
     # la lista de estaciones del sistema especificado
     try:
-        # Obtener el sistema de bicicletas
-        bike_system = pybikes.get(tag)
-        
-        # Actualizar la información de las estaciones
-        bike_system.update()
-        
+        # Reutilizar el sistema ya construido si está en la caché
+        bike_system, ultimo_update = _SISTEMAS.get(tag, (None, 0.0))
+        if bike_system is None:
+            # Obtener el sistema de bicicletas
+            bike_system = pybikes.get(tag)
+            ultimo_update = 0.0
+
+        # Actualizar la información de las estaciones solo si la última
+        # actualización es más antigua que el TTL
+        ahora = time.monotonic()
+        if ahora - ultimo_update > _SISTEMA_TTL:
+            bike_system.update()
+            _SISTEMAS[tag] = (bike_system, ahora)
+
         # Devolver la lista de estaciones
         return bike_system.stations
     except Exception:
@@ -156,21 +199,28 @@ def crear_dataframe_estaciones(estaciones: List) -> pd.DataFrame:
     # Implementa aquí la lógica para convertir la lista de estaciones
     # en un DataFrame de pandas con al menos las columnas:
     # nombre, latitud, longitud, bicicletas disponibles, espacios libres
-    
-    # Crear una lista de diccionarios con los datos de cada estación
-    data = []
-    for station in estaciones:
-        data.append({
-            'name': station.name,
-            'latitude': station.latitude,
-            'longitude': station.longitude,
-            'bikes': station.bikes,
-            'free': station.free
-        })
-    
-    # Convertir la lista a un DataFrame
-    df = pd.DataFrame(data)
-    return df
+
+    # Construir el DataFrame por columnas: pandas las adopta directamente
+    # sin inferir el esquema a partir de un diccionario por estación
+    n = len(estaciones)
+    nombres = [None] * n
+    latitudes = np.empty(n)
+    longitudes = np.empty(n)
+    bicis = np.empty(n, dtype=np.int32)
+    libres = np.empty(n, dtype=np.int32)
+
+    # attrgetter lee los cinco atributos de cada estación en una sola llamada
+    campos = attrgetter('name', 'latitude', 'longitude', 'bikes', 'free')
+    for i, estacion in enumerate(estaciones):
+        nombres[i], latitudes[i], longitudes[i], bicis[i], libres[i] = campos(estacion)
+
+    return pd.DataFrame({
+        'name': nombres,
+        'latitude': latitudes,
+        'longitude': longitudes,
+        'bikes': bicis,
+        'free': libres
+    })
 
 
 def visualizar_estaciones(df: pd.DataFrame) -> None:
@@ -182,13 +232,25 @@ def visualizar_estaciones(df: pd.DataFrame) -> None:
     """
     # Implementa aquí la lógica para crear un gráfico de barras que muestre
     # las 10 estaciones con más bicicletas disponibles
-    
-    # Ordenar por número de bicicletas disponibles y tomar las 10 primeras
-    top_10 = df.nlargest(10, 'bikes')
-    
+
+    # Seleccionar las 10 estaciones con más bicicletas con argpartition,
+    # que encuentra los k mayores sin ordenar el array completo ni crear
+    # un DataFrame intermedio
+    bicis = df['bikes'].to_numpy()
+    k = min(10, len(bicis))
+    if k < len(bicis):
+        indices = np.argpartition(bicis, -k)[-k:]
+    else:
+        indices = np.arange(len(bicis))
+
+    # Ordenar solo las k seleccionadas de mayor a menor
+    indices = indices[np.argsort(-bicis[indices])]
+    top_nombres = df['name'].to_numpy()[indices]
+    top_bicis = bicis[indices]
+
     # Crear el gráfico de barras
     plt.figure(figsize=(12, 6))
-    plt.barh(top_10['name'], top_10['bikes'])
+    plt.barh(top_nombres, top_bicis)
     plt.xlabel('Bicicletas disponibles')
     plt.ylabel('Estación')
     plt.title('Top 10 estaciones con más bicicletas disponibles')
@@ -84,6 +84,27 @@ def test_obtener_estaciones_error(mock_get):
     estaciones = obtener_estaciones("sistema_inexistente")
     assert estaciones is None, "Debe devolver None cuando hay un error"
 
+@patch('pybikes.get')
+def test_obtener_estaciones_cache(mock_get, mock_stations):
+    """
+    Prueba que obtener_estaciones reutiliza el sistema cacheado dentro del TTL.
+    """
+    # Configurar el mock para devolver un sistema simulado
+    mock_system = MagicMock()
+    mock_system.stations = mock_stations
+    mock_get.return_value = mock_system
+
+    # Llamar dos veces seguidas con el mismo tag
+    primera = obtener_estaciones("sistema_cacheado")
+    segunda = obtener_estaciones("sistema_cacheado")
+
+    # El sistema debe construirse y actualizarse una única vez
+    assert primera == mock_stations, "Debe devolver las estaciones del sistema"
+    assert segunda == mock_stations, "La segunda llamada debe devolver las mismas estaciones"
+    assert mock_get.call_count == 1, "El sistema solo debe construirse una vez"
+    mock_get.assert_called_once_with("sistema_cacheado")
+    assert mock_system.update.call_count == 1, "update() solo debe invocarse una vez dentro del TTL"
+
 def test_crear_dataframe_estaciones(mock_stations):
     """
     Prueba la función crear_dataframe_estaciones.